@@ -1,5 +1,11 @@
 import logging
 
+from .runtime import install_event_loop_policy
+
+# Use the fastest available event loop for everything in this package
+# Must happen before any event loop is created
+install_event_loop_policy()
+
 from .communicator import Communicator
 from .server import Server
 
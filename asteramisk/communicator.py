@@ -1,17 +1,27 @@
+import re
 import asyncio
 import aiohttp
 from typing import Union
-from panoramisk import Manager
+from functools import lru_cache
 
 import asteramisk.ui
 import asteramisk.exceptions
 from asteramisk.config import config
 from asteramisk.internal.ari_client import AriClient
+from asteramisk.internal.ami_client import AmiClient
 from asteramisk.internal.async_class import AsyncClass
 
 import logging
 logger = logging.getLogger(__name__)
 
+# Compiled once; a valid caller ID is exactly 10 digits
+_VALID_CALLERID = re.compile(r"\A\d{10}\Z").match
+
+@lru_cache(maxsize=256)
+def _format_callerid(name, number):
+    # Caller IDs repeat across calls, so cache the formatted string
+    return f"{name} <{number}>"
+
 class Communicator(AsyncClass):
     """
     A class for making calls and text message conversations.
@@ -36,6 +46,9 @@ class Communicator(AsyncClass):
             await communicator.make_call(recipient_number="1234567890")
             await communicator.send_message(recipient_number="1234567890", message="Hello world!")
     """
+    # Stasis apps already verified to exist, so we only pay the ARI probe once per process
+    _verified_stasis_apps = set()
+
     async def __create__(self, callerid_number=None, callerid_name=None):
         """
         Initializes the Communicator.
@@ -47,22 +60,24 @@ class Communicator(AsyncClass):
         """
         self._callerid_number = callerid_number
         self._callerid_name = callerid_name
+        # Static portion of the originate request, copied per call
+        self._originate_template = {"app": "asteramisk"}
 
         self._ari_client = await AriClient.create()
-        self._manager = Manager(
-            host=config.ASTERISK_HOST,
-            port=config.ASTERISK_AMI_PORT,
-            username=config.ASTERISK_AMI_USER,
-            secret=config.ASTERISK_AMI_PASS,
-            ssl=False
-        )
-        await self._manager.connect()
+        self._manager = await AmiClient.create()
+        # AmiClient.create() returns an already-connected manager
+        self._connected = True
 
     async def connect(self):
+        # Idempotent, so the context-manager pattern doesn't log in twice
+        if self._connected:
+            return
         await self._manager.connect()
+        self._connected = True
 
     async def close(self):
-        self._manager.close()
+        # The manager is shared process-wide, so don't close it here
+        pass
 
     async def __aenter__(self):
         return self
@@ -109,46 +124,31 @@ class Communicator(AsyncClass):
         # Convert to string in case its int
         callerid_number = str(callerid_number)
 
-        if callerid_number and len(callerid_number) != 10:
-            logger.warning(f"Caller ID number {callerid_number} is not 10 digits. It will not work. Will be replaced with default number.")
+        if callerid_number and not _VALID_CALLERID(callerid_number):
+            logger.warning("Caller ID number %s is not 10 digits. It will not work. Will be replaced with default number.", callerid_number)
             callerid_number = config.SYSTEM_PHONE_NUMBER
 
-        logger.info(f"Making call to {recipient_number} on channel {channel}")
+        logger.info("Making call to %s on channel %s", recipient_number, channel)
 
-        channel = await self._ari_client.channels.originate(
-            endpoint=channel,
-            app="asteramisk",
-            callerId=f"{callerid_name} <{callerid_number}>",
-            timeout=timeout or config.OUTBOUND_CALL_TIMEOUT
-        )
-        logger.info(f"Created channel {channel.json['name']} with ID {channel.json['id']}")
+        originate_kwargs = self._originate_template.copy()
+        originate_kwargs["endpoint"] = channel
+        originate_kwargs["callerId"] = _format_callerid(callerid_name, callerid_number)
+        originate_kwargs["timeout"] = timeout or config.OUTBOUND_CALL_TIMEOUT
+        channel = await self._ari_client.channels.originate(**originate_kwargs)
+        logger.info("Created channel %s with ID %s", channel.json['name'], channel.json['id'])
 
         # All the following in one try/except block to catch originating UI hangups (asyncio.CancelledError)
         try:
 
-            # Poll for the channel to be ready
-            start_time = asyncio.get_event_loop().time()
             timeout = timeout or config.OUTBOUND_CALL_TIMEOUT or 30
-            while asyncio.get_event_loop().time() - start_time < timeout:
-                try:
-                    channel = await self._ari_client.channels.get(channelId=channel.json['id'])
-                    state = channel.json['state']
-                    if state == "Up":
-                        logger.debug(f"Channel {channel.json['name']} is now Up, Detected via polling")
-                        break
-                except aiohttp.web_exceptions.HTTPNotFound:
-                    raise asteramisk.exceptions.CallFailedException("Call failed. Channel destroyed before being ready.")
-                await asyncio.sleep(0.1)
-            else:
-                # Timed out
-                raise asteramisk.exceptions.CallFailedException("Call failed. Reached timeout waiting for channel to be answered.")
-            
-            logger.debug(f"Dialled out to {recipient_number} on channel {channel.json['name']} successfully")
+            # Wait for the channel and verify the Stasis app concurrently, overlapping the two ARI round-trips
+            # The app probe is cached after the first call, so this usually degenerates to the channel wait alone
+            channel, _ = await asyncio.gather(
+                self._wait_for_channel_up(channel, timeout),
+                self._verify_stasis_app(),
+            )
 
-            try:
-                await self._ari_client.applications.get(applicationName="asteramisk")
-            except aiohttp.web_exceptions.HTTPNotFound:
-                raise asteramisk.exceptions.AsteramiskException("The default `asteramisk` Stasis application was not found. This should not happen as it is created on server startup.")
+            logger.debug(f"Dialled out to {recipient_number} on channel {channel.json['name']} successfully")
 
             ui = await asteramisk.ui.VoiceUI.create(channel)
             # I know this seems strange, but audio simply won't play via audio socket until we play a sound file like this
@@ -161,6 +161,40 @@ class Communicator(AsyncClass):
             await channel.hangup()
             raise
 
+    async def _wait_for_channel_up(self, channel, timeout):
+        """
+        Poll ARI until the channel state is Up and return the refreshed channel.
+        Not a public API function
+        :raises asteramisk.exceptions.CallFailedException: If the channel is destroyed or never comes up
+        """
+        start_time = asyncio.get_event_loop().time()
+        while asyncio.get_event_loop().time() - start_time < timeout:
+            try:
+                channel = await self._ari_client.channels.get(channelId=channel.json['id'])
+                state = channel.json['state']
+                if state == "Up":
+                    logger.debug(f"Channel {channel.json['name']} is now Up, Detected via polling")
+                    return channel
+            except aiohttp.web_exceptions.HTTPNotFound:
+                raise asteramisk.exceptions.CallFailedException("Call failed. Channel destroyed before being ready.")
+            await asyncio.sleep(0.1)
+        # Timed out
+        raise asteramisk.exceptions.CallFailedException("Call failed. Reached timeout waiting for channel to be answered.")
+
+    async def _verify_stasis_app(self):
+        """
+        Check once per process that the default asteramisk Stasis application exists.
+        Not a public API function
+        :raises asteramisk.exceptions.AsteramiskException: If the application is missing
+        """
+        if "asteramisk" in self._verified_stasis_apps:
+            return
+        try:
+            await self._ari_client.applications.get(applicationName="asteramisk")
+        except aiohttp.web_exceptions.HTTPNotFound:
+            raise asteramisk.exceptions.AsteramiskException("The default `asteramisk` Stasis application was not found. This should not happen as it is created on server startup.")
+        self._verified_stasis_apps.add("asteramisk")
+
     async def make_text(self,
                         recipient_number, # No reason to make this optional
                         callerid_number=None,
@@ -45,6 +45,9 @@ class Config:
     AUDIOSOCKET_PORT = os.getenv('AUDIOSOCKET_PORT', '0')
     """ The port on which asteramisk's audiosocket server is listening for incoming audio. Default is 0, which means asteramisk will use a random available port. """
 
+    AUDIOSOCKET_ACCEPTORS = os.getenv('AUDIOSOCKET_ACCEPTORS', 1)
+    """ The number of parallel audiosocket accept loops. Values above 1 use SO_REUSEPORT listener sockets so the kernel spreads incoming connections across them. Default is 1. """
+
     SYSTEM_PHONE_NUMBER = os.getenv('SYSTEM_PHONE_NUMBER')
     """ The phone number associated with your telephony system. Used as the caller ID when making outgoing calls, if not specified in your code. """
     SYSTEM_NAME = os.getenv('SYSTEM_NAME', 'Default')
@@ -59,6 +62,12 @@ class Config:
     DEFAULT_GPT_MODEL = os.getenv('DEFAULT_GPT_MODEL', 'gpt-4o-mini')
     """ The default model used by UI.run_agent(). Default is gpt-4o-mini """
 
+    TTS_CONCURRENCY = os.getenv('TTS_CONCURRENCY', 3)
+    """ The maximum number of text to speech synthesis requests that may be in flight at once. Default is 3. """
+
+    TTS_CACHE_MAX_BYTES = os.getenv('TTS_CACHE_MAX_BYTES', 512 * 1024 * 1024)
+    """ The maximum total size in bytes of the on-disk text to speech cache. Least recently used files are deleted when the cap is exceeded. Default is 512MiB. """
+
     ADMIN_PHONE_NUMBER = os.getenv('ADMIN_PHONE_NUMBER')
     """ The default phone number for the notifier module to use wnen you send an error message. """
 
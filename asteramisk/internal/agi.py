@@ -1,36 +1,44 @@
 import asyncio
-from panoramisk.manager import Manager
 
-from asteramisk.config import config
 from asteramisk.exceptions import AGIException
+from asteramisk.internal.ami_client import AmiClient
 from asteramisk.internal.async_class import AsyncClass
 
 import logging
 logger = logging.getLogger(__name__)
 
 class AsteriskGatewayInterface(AsyncClass):
+    # Handlers indexed by event name, then channel name (None = any channel)
+    # One real panoramisk callback per event name dispatches by dict lookup,
+    # so an AMI event costs O(1) instead of one Python callback per instance
+    _channel_handlers = {}
+    _dispatched_events = set()
+
     async def __create__(self):
-        self._manager = Manager(
-            host=config.ASTERISK_HOST,
-            port=config.ASTERISK_AMI_PORT,
-            username=config.ASTERISK_AMI_USER,
-            secret=config.ASTERISK_AMI_PASS,
-            ssl=False
-        )
-        await self._manager.connect()
+        self._manager = await AmiClient.create()
+        # AmiClient.create() returns an already-connected manager
+        self._connected = True
+
+    async def __aenter__(self):
+        return self
 
-    def __del__(self):
-        self._manager.close()
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
 
     @property
     def channel(self):
         raise NotImplementedError
 
     async def connect(self):
+        # Idempotent, so repeated calls don't log in twice
+        if self._connected:
+            return
         await self._manager.connect()
+        self._connected = True
 
     async def close(self):
-        self._manager.close()
+        # The manager is shared process-wide, so don't close it here
+        pass
 
     async def send_command(self, command):
         """ Send an AGI command to asterisk. """
@@ -41,14 +49,49 @@ class AsteriskGatewayInterface(AsyncClass):
         response = await self.send_command(f"GET VARIABLE {name}")
         if 'error' in response and 'msg' in response:
             raise AGIException(response['msg'])
-        logger.info(f"Got variable {name}: {response['result'][1]}")
+        logger.info("Got variable %s: %s", name, response['result'][1])
         return response['result'][1]
 
     async def set_variable(self, name: str, value: str) -> str:
         """ Set Asterisk channel variable. Sends SET VARIABLE AGI command """
-        logger.info(f"Setting variable {name} to {value}")
+        logger.info("Setting variable %s to %s", name, value)
         return await self.send_command(f"SET VARIABLE {name} {value}")
 
+    def _ensure_dispatcher(self, event: str):
+        """ Install the single panoramisk callback for this event name, once per process """
+        cls = AsteriskGatewayInterface
+        if event in cls._dispatched_events:
+            return
+        handlers = cls._channel_handlers.setdefault(event, {})
+
+        def dispatcher(manager, evt):
+            # Any-channel handlers live under the None key, so only consult the
+            # channel-keyed handlers when the event actually names a channel —
+            # otherwise both lookups hit None and every handler fires twice
+            channel = evt.get('Channel')
+            if channel is not None:
+                for callback in handlers.get(channel, ()):
+                    asyncio.create_task(callback(evt))
+            # Handlers registered with this_channel_only=False
+            for callback in handlers.get(None, ()):
+                asyncio.create_task(callback(evt))
+
+        self._manager.register_event(event, dispatcher)
+        cls._dispatched_events.add(event)
+
+    def _add_channel_handler(self, event: str, channel, callback):
+        self._ensure_dispatcher(event)
+        handlers = AsteriskGatewayInterface._channel_handlers.setdefault(event, {})
+        handlers.setdefault(channel, []).append(callback)
+
+    def _remove_channel_handler(self, event: str, channel, callback):
+        handlers = AsteriskGatewayInterface._channel_handlers.get(event, {})
+        callbacks = handlers.get(channel, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+        if not callbacks:
+            handlers.pop(channel, None)
+
     async def wait_for_event(self, event: str, timeout: int = None, this_channel_only: bool = True):
         """
         Wait for an event.
@@ -57,24 +100,23 @@ class AsteriskGatewayInterface(AsyncClass):
         :param this_channel_only: Only wait for the specified event on this channel
         :return: Event
         """
-        result_event = asyncio.Event()
-        result = None
+        future = asyncio.get_running_loop().create_future()
 
-        def channel_event_callback(manager, event):
-            logger.info(f"Channel event: {event}")
-            nonlocal result
-            if (this_channel_only and 'Channel' in event and event['Channel'] == self.channel) or not this_channel_only:
-                result = event
-                result_event.set()
+        async def one_shot(evt):
+            logger.info(f"Channel event: {evt}")
+            if not future.done():
+                future.set_result(evt)
 
-        self.manager.register_event(event, channel_event_callback)
+        channel = self.channel if this_channel_only else None
+        self._add_channel_handler(event, channel, one_shot)
 
         logger.info(f"Waiting for event {event}")
-        if timeout:
-            await asyncio.wait_for(result_event.wait(), timeout)
-        else:
-            await result_event.wait()
-        return result
+        try:
+            if timeout:
+                return await asyncio.wait_for(future, timeout)
+            return await future
+        finally:
+            self._remove_channel_handler(event, channel, one_shot)
 
     async def register_event_handler(self, event: str, callback, this_channel_only: bool = True):
         """
@@ -85,11 +127,7 @@ class AsteriskGatewayInterface(AsyncClass):
         :param this_channel_only: Only listen for the specified event on this channel
         :return: None
         """
-        def channel_event_callback(manager, event):
-            if (this_channel_only and 'Channel' in event and event['Channel'] == self.channel) or not this_channel_only:
-                asyncio.create_task(callback(event))
-
-        self.manager.register_event(event, channel_event_callback)
+        self._add_channel_handler(event, self.channel if this_channel_only else None, callback)
         logger.info(f"Registered event handler for {event}")
         return
 
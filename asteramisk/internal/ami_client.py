@@ -0,0 +1,33 @@
+import asyncio
+from panoramisk import Manager
+
+from asteramisk.config import config
+
+class AmiClient:
+    """ Basically a singleton wrapper for panoramisk.Manager """
+    _instance = None
+    _lock = None
+
+    @classmethod
+    async def create(cls, ami_host=config.ASTERISK_HOST, ami_port=config.ASTERISK_AMI_PORT, ami_user=config.ASTERISK_AMI_USER, ami_pass=config.ASTERISK_AMI_PASS):
+        if cls._instance:
+            return cls._instance
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        # Double-checked so concurrent cold-start callers don't each log in an AMI connection
+        async with cls._lock:
+            if not cls._instance:
+                manager = Manager(
+                    host=ami_host,
+                    port=ami_port,
+                    username=ami_user,
+                    secret=ami_pass,
+                    ssl=False
+                )
+                await manager.connect()
+                cls._instance = manager
+        return cls._instance
+
+    @classmethod
+    def is_instantiated(cls):
+        return cls._instance is not None
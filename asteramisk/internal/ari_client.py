@@ -1,3 +1,4 @@
+import asyncio
 import aioari
 
 from asteramisk.config import config
@@ -5,11 +6,18 @@ from asteramisk.config import config
 class AriClient:
     """ Basically a singleton wrapper for aioari.Client """
     _instance = None
+    _lock = None
 
     @classmethod
     async def create(cls, ari_host=config.ASTERISK_HOST, ari_port=config.ASTERISK_ARI_PORT, ari_user=config.ASTERISK_ARI_USER, ari_pass=config.ASTERISK_ARI_PASS):
-        if not cls._instance:
-            cls._instance = await aioari.connect(f"http://{ari_host}:{ari_port}", ari_user, ari_pass)
+        if cls._instance:
+            return cls._instance
+        if cls._lock is None:
+            cls._lock = asyncio.Lock()
+        # Double-checked so concurrent cold-start callers don't each open an ARI session
+        async with cls._lock:
+            if not cls._instance:
+                cls._instance = await aioari.connect(f"http://{ari_host}:{ari_port}", ari_user, ari_pass)
         return cls._instance
 
     @classmethod
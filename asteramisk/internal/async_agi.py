@@ -1,3 +1,4 @@
+import uuid
 import asyncio
 from panoramisk.actions import Action
 from panoramisk.fast_agi import parse_agi_result
@@ -6,39 +7,89 @@ from asteramisk.exceptions import AGIException
 from .agi import AsteriskGatewayInterface
 
 class AsyncAsteriskGatewayInterface(AsteriskGatewayInterface):
-    """ 
+    """
     Asynchronous AGI interface
     Fully compatible and interchangeable with the synchronous AGI interface
     :param channel: Channel name. The channel must already have been put into Async AGI mode via AGI(agi:async) in the dialplan or AMI command
     """
+    # Outstanding commands across all instances, keyed by CommandID
+    # One manager-level dispatcher routes AsyncAGIExec events to these futures
+    _pending = {}
+    _dispatcher_registered = False
+
     async def __create__(self, channel):
         self._channel = channel
         await super().__create__()
+        cls = type(self)
+        if not cls._dispatcher_registered:
+            self._manager.register_event("AsyncAGIExec", cls._agi_exec_dispatcher)
+            cls._dispatcher_registered = True
 
     @property
     def channel(self):
         return self._channel
 
+    @classmethod
+    def _agi_exec_dispatcher(cls, manager, event):
+        entry = cls._pending.get(event.get('CommandID'))
+        if entry is None:
+            return
+        channel, future = entry
+        if 'Channel' in event and event['Channel'] != channel:
+            return
+        if not future.done():
+            future.set_result(parse_agi_result(event['Result']))
+
     async def send_command(self, command):
         """ Sends AGI command """
-        # This function is called by all the others so we need to make sure the manager is connected here
-        result_event = asyncio.Event()
-        result = None
-
-        def agi_exec_event_callback(manager, event):
-            nonlocal result
-            result = parse_agi_result(event['Result'])
-            result_event.set()
+        command_id = uuid.uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        # Insert before send_action so a fast AsyncAGIExec can't be missed
+        self._pending[command_id] = (self.channel, future)
 
         action = Action({
             "Action": "AGI",
             "Channel": self.channel,
-            "Command": command
+            "Command": command,
+            "CommandID": command_id
         })
-        await self._manager.send_action(action)
-        self._manager.register_event("AsyncAGIExec", agi_exec_event_callback)
-        await result_event.wait()
+        try:
+            await self._manager.send_action(action)
+            result = await future
+        finally:
+            self._pending.pop(command_id, None)
         if 'error' in result and 'msg' in result:
             raise AGIException(result['msg'])
         return result
 
+    async def send_commands(self, commands):
+        """
+        Send several AGI commands back-to-back and await all of their results concurrently
+        Faster than awaiting send_command in a loop because the AMI round-trips overlap
+        :param commands: List of AGI command strings
+        :return: List of results, in the same order as the commands
+        """
+        loop = asyncio.get_running_loop()
+        command_ids = []
+        futures = []
+        try:
+            for command in commands:
+                command_id = uuid.uuid4().hex
+                future = loop.create_future()
+                self._pending[command_id] = (self.channel, future)
+                command_ids.append(command_id)
+                futures.append(future)
+                await self._manager.send_action(Action({
+                    "Action": "AGI",
+                    "Channel": self.channel,
+                    "Command": command,
+                    "CommandID": command_id
+                }))
+            results = await asyncio.gather(*futures)
+        finally:
+            for command_id in command_ids:
+                self._pending.pop(command_id, None)
+        for result in results:
+            if 'error' in result and 'msg' in result:
+                raise AGIException(result['msg'])
+        return results
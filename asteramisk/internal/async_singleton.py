@@ -1,3 +1,5 @@
+import asyncio
+
 from .async_class import AsyncClass
 
 class AsyncSingleton(AsyncClass):
@@ -10,7 +12,15 @@ class AsyncSingleton(AsyncClass):
 
     @classmethod
     async def create(cls, *args, **kwargs):
-        if not cls._instance:
-            cls._instance = cls(async_creation=True)
-            await cls._instance.__create__(*args, **kwargs)
+        if cls._instance:
+            return cls._instance
+        # One lock per subclass, since each subclass has its own instance
+        if '_creation_lock' not in cls.__dict__:
+            cls._creation_lock = asyncio.Lock()
+        # Double-checked so concurrent creators don't run __create__ twice
+        async with cls._creation_lock:
+            if not cls._instance:
+                instance = cls(async_creation=True)
+                await instance.__create__(*args, **kwargs)
+                cls._instance = instance
         return cls._instance
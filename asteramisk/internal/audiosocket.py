@@ -12,7 +12,8 @@ logger = logging.getLogger(__name__)
 class AudiosocketAsync(AsyncSingleton):
     async def __create__(self, bind_addr=config.AUDIOSOCKET_BINDADDR, bind_port=config.AUDIOSOCKET_PORT, timeout=None):
         logger.debug("AsyncAudiosocket.__create__")
-        self.connections = {}
+        # Futures keyed by stream_id. accept() awaits them, _listen_loop resolves them
+        self._waiters = {}
 
         if not bind_addr:
             raise ValueError("No bind address specified for audiosocket. You must specify a bind address, either by setting the AUDIOSOCKET_BINDADDR environment variable, setting config.AUDIOSOCKET_BINDADDR, or by passing it as a parameter to the constructor.")
@@ -23,43 +24,92 @@ class AudiosocketAsync(AsyncSingleton):
         self.addr = bind_addr
         self.port = int(bind_port)
 
-        self.initial_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self.initial_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        try:
-            self.initial_sock.bind((self.addr, self.port))
-        except OSError as e:
-            raise OSError(f"Failed to bind audiosocket to {self.addr}:{self.port}: {e}")
-        self.initial_sock.settimeout(timeout)
-        self.initial_sock.setblocking(False)
-        self.initial_sock.listen(100)
+        self.initial_sock = self._create_listen_socket(self.addr, self.port, timeout)
         # If the user doesn't specify a port, we use the one we got
         self.port = self.initial_sock.getsockname()[1]
-        # Start the listening loop
-        self._listen_task = asyncio.create_task(self._listen_loop())
 
-    async def _listen_loop(self):
+        self._listen_socks = [self.initial_sock]
+        acceptors = int(config.AUDIOSOCKET_ACCEPTORS)
+        if acceptors > 1 and hasattr(socket, 'SO_REUSEPORT'):
+            # Extra SO_REUSEPORT listeners on the same port; the kernel load-balances handshakes across them
+            for _ in range(acceptors - 1):
+                self._listen_socks.append(self._create_listen_socket(self.addr, self.port, timeout))
+        # Start the listening loops
+        self._listen_tasks = [asyncio.create_task(self._listen_loop(sock)) for sock in self._listen_socks]
+
+    def _create_listen_socket(self, addr, port, timeout=None):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # Allow parallel listeners on the same port (Linux); harmless to skip elsewhere
+        if hasattr(socket, 'SO_REUSEPORT'):
+            with suppress(OSError):
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        # Audio frames are tiny but call surges are bursty, so raise the socket buffers well above the default
+        with suppress(OSError):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 * 1024 * 1024)
+        try:
+            sock.bind((addr, port))
+        except OSError as e:
+            raise OSError(f"Failed to bind audiosocket to {addr}:{port}: {e}")
+        sock.settimeout(timeout)
+        sock.setblocking(False)
+        # Ask for the largest backlog the kernel allows; a hardcoded number
+        # smaller than net.core.somaxconn drops SYNs during call-setup bursts
+        sock.listen(socket.SOMAXCONN)
+        return sock
+
+    async def _listen_loop(self, sock):
         """
         The main listening loop for the audiosocket
         Continuously accepts new connections from asterisk
         """
         logger.debug("AsyncAudiosocket._listen_loop")
+        loop = asyncio.get_running_loop()
         while True:
-            audconn = await self.listen()
-            logger.debug("AsyncAudiosocket._listen_loop: audconn created")
-            try:
-                stream_id = await audconn.get_uuid()
-            except asyncio.TimeoutError:
-                logger.error("AsyncAudiosocket._listen_loop: timed out waiting for uuid. We probably dropped a call")
-                continue
-            self.connections[stream_id] = audconn
-            logger.debug(f"AsyncAudiosocket._listen_loop: added connection {stream_id}")
+            conn, peer_addr = await loop.sock_accept(sock)
+            asyncio.create_task(self._handle_connection(conn, peer_addr))
+            # Under a call surge many connections land together, so drain the
+            # whole accept queue before going back to the selector
+            while True:
+                try:
+                    conn, peer_addr = sock.accept()
+                except (BlockingIOError, InterruptedError):
+                    break
+                conn.setblocking(False)
+                asyncio.create_task(self._handle_connection(conn, peer_addr))
+
+    async def _handle_connection(self, conn, peer_addr):
+        """
+        Set up one accepted connection and hand it to the waiting accept() call
+        Runs as its own task so a slow UUID handshake doesn't stall other accepts
+        """
+        audconn = await AudioSocketConnectionAsync.create(conn, peer_addr)
+        logger.debug("AsyncAudiosocket._handle_connection: audconn created")
+        try:
+            stream_id = await audconn.get_uuid()
+        except asyncio.TimeoutError:
+            logger.error("AsyncAudiosocket._handle_connection: timed out waiting for uuid. We probably dropped a call")
+            return
+        fut = self._waiters.get(stream_id)
+        if fut is None:
+            # Connection arrived before accept() was called, store a completed future
+            fut = asyncio.get_running_loop().create_future()
+            self._waiters[stream_id] = fut
+        if not fut.done():
+            fut.set_result(audconn)
+        logger.debug(f"AsyncAudiosocket._handle_connection: added connection {stream_id}")
 
     async def accept(self, stream_id):
         logger.debug(f"AsyncAudiosocket.accept: waiting for connection {stream_id}")
-        while stream_id not in self.connections:
-            logger.debug(f"AsyncAudiosocket.accept: waiting for connection {stream_id}")
-            await asyncio.sleep(0.1)
-        return self.connections[stream_id]
+        fut = self._waiters.get(stream_id)
+        if fut is None:
+            fut = asyncio.get_running_loop().create_future()
+            self._waiters[stream_id] = fut
+        try:
+            return await fut
+        finally:
+            self._waiters.pop(stream_id, None)
 
     async def listen(self):
         logger.debug("AsyncAudiosocket.listen")
@@ -74,9 +124,11 @@ class AudiosocketAsync(AsyncSingleton):
         return connection
 
     async def close(self):
-        if self._listen_task:
-            self._listen_task.cancel()
+        for task in self._listen_tasks:
+            task.cancel()
             with suppress(asyncio.CancelledError):
-                await self._listen_task
-            self._listen_task = None
-        self.initial_sock.close()
+                await task
+        self._listen_tasks = []
+        for sock in self._listen_socks:
+            sock.close()
+        self._listen_socks = []
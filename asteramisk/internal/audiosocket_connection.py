@@ -1,5 +1,10 @@
 import uuid
+import socket
+import struct
 import asyncio
+import collections
+import samplerate
+import numpy as np
 from contextlib import suppress
 from dataclasses import dataclass
 
@@ -48,25 +53,80 @@ class errors_struct:
 
 errors = errors_struct()
 
+# Prebuilt frames for the hot send path
+# The keepalive silence frame and the header for full-size audio frames never
+# change, so build them once instead of concatenating on every 20ms tick
+_AUDIO_HDR_320 = types_struct.audio + PCM_SIZE
+_SILENCE_FRAME = _AUDIO_HDR_320 + bytes(PACKET_LENGTH)
+_HANGUP_FRAME = types_struct.hangup * 3
+
+# Type bytes as plain integers: header[0] indexes straight to an int, so the
+# hot-path compare avoids building a one-byte bytes object per frame
+_T_AUDIO = types_struct.audio[0]
+_T_DTMF = types_struct.dtmf[0]
+_T_ERROR = types_struct.error[0]
+_T_UUID = types_struct.uuid[0]
+
+# Prebuilt unpacker for the 16-bit big-endian length header; a cached
+# struct.Struct beats int.from_bytes at frame rate
+_U16BE = struct.Struct('>H')
+
+# Only await writer.drain() once this much is buffered; almost every frame
+# leaves the buffer empty, so the unconditional drain was a wasted await
+_DRAIN_THRESHOLD = 16 * 1024
+
+# Capacity of the outgoing ring buffer, in 320-byte frames (10 seconds of audio)
+_TX_RING_FRAMES = 500
+
 class AudioSocketConnectionAsync(AsyncClass):
     async def __create__(self, conn, peer_addr):
         logger.debug("AsyncConnection.__create__")
         self.conn = conn
         self.peer_addr = peer_addr
+        # Fixed 20ms frames lose badly to Nagle + delayed ACK, so disable
+        # coalescing and give the socket room for bursty writes
+        conn.setblocking(False)
+        with suppress(OSError):
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+            conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+            if hasattr(socket, 'TCP_QUICKACK'):
+                # Linux only: ACK the small frames immediately instead of
+                # holding them for the delayed-ACK timer
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
         self._uuid = None
+        self._uuid_event = asyncio.Event()
         self.connected = True
-        self._rx_q = asyncio.Queue(500)
-        self._tx_q = asyncio.Queue(500)
+        # Bounded deque: maxlen drops the oldest frame in O(1) on overflow,
+        # with an Event for consumer wakeup instead of per-frame queue futures
+        self._rx_q = collections.deque(maxlen=500)
+        self._rx_ready = asyncio.Event()
+        # Outgoing frames live in one contiguous ring of full-size slots
+        # instead of a queue of per-frame bytes objects. head chases tail;
+        # the event provides backpressure when all slots are in use
+        self._tx_ring = bytearray(_TX_RING_FRAMES * PACKET_LENGTH)
+        self._tx_head = 0
+        self._tx_tail = 0
+        self._tx_count = 0
+        self._tx_not_full = asyncio.Event()
+        self._tx_not_full.set()
         self._from_asterisk_resample_factor = 1
         self._to_asterisk_resample_factor = 1
         self._from_asterisk_resampler = None
         self._to_asterisk_resampler = None
+        self._resample_channels = 1
         self._tx_extra_data = b''
-        self._lock = asyncio.Lock()
-        self._to_asterisk_resampler_lock = asyncio.Lock()
-        self._from_asterisk_resampler_lock = asyncio.Lock()
         self._event_callbacks = {}
         self._loop = asyncio.get_running_loop()
+        # Control-frame handlers keyed by type byte; audio stays inline in
+        # _process as the fast path
+        self._dispatch = {
+            _T_DTMF: self._handle_dtmf,
+            _T_ERROR: self._handle_error,
+            _T_UUID: self._handle_uuid,
+        }
+        # Stream wrappers give buffered, correctly-framed reads (readexactly)
+        self._reader, self._writer = await asyncio.open_connection(sock=conn)
         self._task = asyncio.create_task(self._process())
 
     def on(self, event, callback):
@@ -89,23 +149,38 @@ class AudioSocketConnectionAsync(AsyncClass):
         """
         self._from_asterisk_resample_factor = rate / 8000
         self._to_asterisk_resample_factor = 8000 / rate
+        self._resample_channels = channels
 
-        # Start the resampling tasks
-        self._rx_resample_task = asyncio.create_task(self._rx_resample(rate, channels, audio_format))
-        self._tx_resample_task = asyncio.create_task(self._tx_resample(rate, channels, audio_format))
+        # In-process resamplers, one per direction since each keeps its own filter state
+        self._from_asterisk_resampler = samplerate.Resampler('sinc_best', 1)
+        self._to_asterisk_resampler = samplerate.Resampler('sinc_best', 1)
 
     async def stop_resampling(self):
         logger.debug("AsyncConnection.stop_resampling")
-        if hasattr(self, '_rx_resample_task') and self._rx_resample_task is not None:
-            self._rx_resample_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await self._rx_resample_task
-        if hasattr(self, '_tx_resample_task') and self._tx_resample_task is not None:
-            self._tx_resample_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await self._tx_resample_task
+        self._from_asterisk_resampler = None
+        self._to_asterisk_resampler = None
         logger.debug("AsyncConnection.stop_resampling: done")
 
+    def _resample_from_asterisk(self, audio):
+        """ Resample 8KHz mono audio from Asterisk to the configured rate and channel count """
+        audio_np = np.frombuffer(audio, dtype=np.int16).astype(np.float32)
+        resampled = self._from_asterisk_resampler.process(audio_np, self._from_asterisk_resample_factor)
+        resampled = resampled.astype(np.int16)
+        if self._resample_channels > 1:
+            # Asterisk audio is mono, duplicate the samples across channels
+            resampled = np.repeat(resampled, self._resample_channels)
+        return resampled.tobytes()
+
+    def _resample_to_asterisk(self, audio):
+        """ Resample audio at the configured rate and channel count to the 8KHz mono Asterisk expects """
+        audio_np = np.frombuffer(audio, dtype=np.int16)
+        if self._resample_channels > 1:
+            # Downmix interleaved channels to mono
+            audio_np = audio_np.reshape(-1, self._resample_channels).mean(axis=1)
+        audio_np = audio_np.astype(np.float32)
+        resampled = self._to_asterisk_resampler.process(audio_np, self._to_asterisk_resample_factor)
+        return resampled.astype(np.int16).tobytes()
+
     async def get_uuid(self):
         """
         Waits for the connection UUID to be sent from Asterisk and returns it
@@ -113,32 +188,23 @@ class AudioSocketConnectionAsync(AsyncClass):
         :return: UUID
         :raises: asyncio.TimeoutError
         """
-        async def _get_uuid():
-            while self._uuid is None:
-                logger.debug("AsyncConnection.get_uuid: waiting for uuid")
-                await asyncio.sleep(0.1)
-        await asyncio.wait_for(_get_uuid(), timeout=5)
+        await asyncio.wait_for(self._uuid_event.wait(), timeout=5)
         return self._uuid
 
     async def clear_send_queue(self):
         """Clear the send queue. Cancels any audio that is currently being sent"""
         logger.debug("AsyncConnection.clear_send_queue")
-        while True:
-            try:
-                await asyncio.wait_for(self._tx_q.get(), timeout=0.5)
-                self._tx_q.task_done()
-            except asyncio.TimeoutError:
-                break
+        # Resetting the indices abandons every queued frame in place
+        self._tx_head = 0
+        self._tx_tail = 0
+        self._tx_count = 0
+        self._tx_not_full.set()
 
     async def clear_receive_queue(self):
         """Clear the receive queue. Discards any audio that has been received but not yet read"""
         logger.debug("AsyncConnection.clear_receive_queue")
-        while True:
-            try:
-                await asyncio.wait_for(self._rx_q.get(), timeout=0.2)
-                self._rx_q.task_done()
-            except asyncio.TimeoutError:
-                break
+        # Non-blocking drain, returns as soon as the queue is physically empty
+        self._rx_q.clear()
 
     async def drain_send_queue(self):
         logger.debug("AsyncConnection.drain_send_queue")
@@ -148,20 +214,30 @@ class AudioSocketConnectionAsync(AsyncClass):
             if not self.connected:
                 # Hangup happenned, stop waiting
                 break
-            if self._tx_q.qsize() == 0:
+            if self._tx_count == 0:
                 # Queue is empty, stop waiting
                 break
             await asyncio.sleep(0.1)
 
         logger.debug("AsyncConnection.drain_send_queue: done")
 
-    def _split_data(self, data):
-        if len(data) < 3:
-            print('[AUDIOSOCKET WARNING] The data received was less than 3 bytes, ' +
-                  'the minimum length data from Asterisk AudioSocket should be.')
-            return b'\x00', 0, bytes(PACKET_LENGTH)
-        else:
-            return data[:1], int.from_bytes(data[1:3], 'big'), data[3:]
+    def _handle_dtmf(self, payload):
+        logger.debug(f"AsyncConnection._process DTMF: {payload}")
+        if 'dtmf' in self._event_callbacks:
+            asyncio.create_task(self._event_callbacks['dtmf'](payload))
+
+    def _handle_error(self, payload):
+        logger.debug(f"AsyncConnection._process ERROR: {payload}")
+        if 'error' in self._event_callbacks:
+            asyncio.create_task(self._event_callbacks['error'](payload))
+        self._decode_error(payload)
+
+    def _handle_uuid(self, payload):
+        logger.debug(f"AsyncConnection._process UUID: {payload}")
+        if 'uuid' in self._event_callbacks:
+            asyncio.create_task(self._event_callbacks['uuid'](payload))
+        self._uuid = str(uuid.UUID(bytes=payload))
+        self._uuid_event.set()
 
     def _decode_error(self, payload):
         if payload == errors.none:
@@ -174,106 +250,41 @@ class AudioSocketConnectionAsync(AsyncClass):
             logger.error('[ASTERISK ERROR] Memory allocation error')
         return
 
-    async def _stop_process(self, process):
-        # Send EOF to the process, and wait for stdin to close
-        process.stdin.close()
-        await process.stdin.wait_closed()
-
-        # Read to EOF from stdout so that it won't get stuck
-        #_ = await process.stdout.read()
-        
-        # Try to terminate the process gracefully
-        process.terminate()
-        try:
-            await asyncio.wait_for(process.wait(), timeout=5)
-        except asyncio.TimeoutError:
-            # If the process is still running, kill it forcibly
-            process.kill()
-            await process.wait()
-
-    async def _rx_resample(self, rate, channels, audio_format):
-        logger.debug("AsyncConnection._rx_resample_task")
-        # Create the resampler: an ffmpeg process
-        self._from_asterisk_resampler = await asyncio.create_subprocess_exec(
-            'ffmpeg',
-            '-hide_banner',
-            '-loglevel', 'error',
-            '-fflags', '+flush_packets',
-            '-f', 's16le',
-            '-ar', '8000', # Asterisk end fixed to 8KHz
-            '-ac', '1', # Asterisk end fixed to mono
-            '-i', 'pipe:0',
-            '-f', 's16le',
-            '-ar', str(rate),
-            '-ac', str(channels),
-            'pipe:1',
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE
-        )
-        try:
-            while self.connected:
-                audio = await self._rx_q.get()
-                self._from_asterisk_resampler.stdin.write(audio)
-                await self._from_asterisk_resampler.stdin.drain()
-                self._rx_q.task_done()
-        finally:
-            # Clean up the resources we use in this task
-            await self._stop_process(self._from_asterisk_resampler)
-            self._from_asterisk_resampler = None
-            logger.debug("AsyncConnection._rx_resample_task: done")
-
-    async def _tx_resample(self, rate, channels, audio_format):
-        logger.debug("AsyncConnection._tx_resample_task")
-        # Create the resampler: an ffmpeg process
-        self._to_asterisk_resampler = await asyncio.create_subprocess_exec(
-            'ffmpeg',
-            '-hide_banner',
-            '-loglevel', 'error',
-            '-fflags', '+flush_packets',
-            '-f', 's16le',
-            '-ar', str(rate),
-            '-ac', str(channels),
-            '-i', 'pipe:0',
-            '-f', 's16le',
-            '-ar', '8000', # Asterisk end fixed to 8KHz
-            '-ac', '1', # Asterisk end fixed to mono
-            'pipe:1',
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE
-        )
-        try:
-            while self.connected:
-                async with self._to_asterisk_resampler_lock:
-                    audio = await self._to_asterisk_resampler.stdout.read(PACKET_LENGTH)
-                await self._write_to_tx_queue(audio)
-        finally:
-            # Clean up the resources we use in this task
-            await self._stop_process(self._to_asterisk_resampler)
-            self._to_asterisk_resampler = None
-            logger.debug("AsyncConnection._tx_resample_task: done")
+    async def _tx_put(self, frame):
+        """
+        Copy one full-size frame into the next free ring slot.
+        Waits for the consumer when every slot is in use.
+        """
+        while self._tx_count >= _TX_RING_FRAMES:
+            self._tx_not_full.clear()
+            await self._tx_not_full.wait()
+        offset = self._tx_tail * PACKET_LENGTH
+        self._tx_ring[offset : offset + PACKET_LENGTH] = frame
+        self._tx_tail = (self._tx_tail + 1) % _TX_RING_FRAMES
+        self._tx_count += 1
 
     async def _write_to_tx_queue(self, audio):
         """
         Write audio to the send queue, chunkify it if it is greater than PACKET_LENGTH bytes
         """
         # Add the extra data from last time
-        audio = self._tx_extra_data + audio
-        self._tx_extra_data = b''
-        # If the audio data is greater than PACKET_LENGTH bytes, write it in PACKET_LENGTH byte chunks
-        if len(audio) > PACKET_LENGTH:
-            for i in range(0, len(audio), PACKET_LENGTH):
-                chunk = audio[i : i + PACKET_LENGTH]
-                if len(chunk) == PACKET_LENGTH:
-                    await self._tx_q.put(chunk)
-                elif len(chunk) < PACKET_LENGTH:
-                    self._tx_extra_data = chunk
-                    break
-                else:
-                    raise ValueError("Audio chunk is greater than PACKET_LENGTH bytes")
-        elif len(audio) < PACKET_LENGTH:
+        if self._tx_extra_data:
+            audio = self._tx_extra_data + audio
+            self._tx_extra_data = b''
+        length = len(audio)
+        if length == PACKET_LENGTH:
+            await self._tx_put(audio)
+            return
+        if length < PACKET_LENGTH:
             self._tx_extra_data = audio
-        else:
-            await self._tx_q.put(audio)
+            return
+        # Scan with a memoryview; each full chunk is copied straight into
+        # its ring slot without an intermediate bytes object
+        buf = memoryview(audio)
+        whole = length - (length % PACKET_LENGTH)
+        for i in range(0, whole, PACKET_LENGTH):
+            await self._tx_put(buf[i : i + PACKET_LENGTH])
+        self._tx_extra_data = bytes(buf[whole:])
 
     async def read(self):
         """
@@ -285,15 +296,13 @@ class AudioSocketConnectionAsync(AsyncClass):
         #logger.debug("AsyncConnection.read")
         if not self.connected:
             raise InvalidStateException("Unable to read audio. Connection is not connected")
+        while not self._rx_q:
+            await self._rx_ready.wait()
+            self._rx_ready.clear()
+        audio = self._rx_q.popleft()
         if self._from_asterisk_resampler:
-            bytes_to_read = int(PACKET_LENGTH * self._from_asterisk_resample_factor)
-            async with self._from_asterisk_resampler_lock:
-                data = await self._from_asterisk_resampler.stdout.read(bytes_to_read)
-            return data
-        else:
-            audio = await self._rx_q.get()
-            self._rx_q.task_done()
-            return audio
+            return self._resample_from_asterisk(audio)
+        return audio
 
     async def write(self, data):
         """
@@ -307,10 +316,8 @@ class AudioSocketConnectionAsync(AsyncClass):
         if not self.connected:
             raise InvalidStateException("Unable to write audio. Connection is not connected")
         if self._to_asterisk_resampler:
-            self._to_asterisk_resampler.stdin.write(data)
-            await self._to_asterisk_resampler.stdin.drain()
-        else:
-            await self._write_to_tx_queue(data)
+            data = self._resample_to_asterisk(data)
+        await self._write_to_tx_queue(data)
 
     async def send_hangup(self):
         """
@@ -323,62 +330,77 @@ class AudioSocketConnectionAsync(AsyncClass):
         logger.debug("AsyncConnection.hangup")
         if hasattr(self, 'hangup_sent') and self.hangup_sent:
             return
-        async with self._lock:
-            await self._loop.sock_sendall(self.conn, types.hangup * 3)
-            self.hangup_sent = True
+        # writer.write appends whole frames atomically, so no lock is needed
+        self._writer.write(_HANGUP_FRAME)
+        with suppress(ConnectionResetError):
+            await self._writer.drain()
+        self.hangup_sent = True
 
     async def _process(self):
         try:
             logger.debug("AsyncConnection._process")
+            # Bind the hot-path lookups to locals once; at 50 frames/sec per
+            # connection the attribute chains add up
+            readexactly = self._reader.readexactly
+            writer_write = self._writer.write
+            writer_drain = self._writer.drain
+            rx_append = self._rx_q.append
+            rx_ready_set = self._rx_ready.set
+            tx_ring = memoryview(self._tx_ring)
+            tx_not_full_set = self._tx_not_full.set
+            audio_type = _T_AUDIO
+            dispatch = self._dispatch
+            unpack_len = _U16BE.unpack_from
+            buffered = self._writer.transport.get_write_buffer_size
             while self.connected:
-                data = None
+                # Read exactly one frame: 1 type byte, 2 length bytes, then the payload
+                # readexactly keeps framing correct when TCP splits or coalesces segments
                 try:
-                    data = await self._loop.sock_recv(self.conn, 323)
-                except ConnectionResetError:
-                    pass
-                if not data:
+                    header = await readexactly(3)
+                    length = unpack_len(header, 1)[0]
+                    payload = await readexactly(length) if length else b''
+                except (asyncio.IncompleteReadError, ConnectionResetError):
                     break
-                type_byte, length, payload = self._split_data(data)
-                if type_byte == types.audio:
-                    if self._rx_q.full():
-                        #logger.debug('[AUDIOSOCKET WARNING] The inbound audio queue is full! This most ' +
-                        #      'likely occurred because the read() method is not being called, dropping oldest frame')
-                        # Get and discard the oldest frame
-                        self._rx_q.get_nowait()
-                        self._rx_q.task_done()
-                    await self._rx_q.put(payload)
-                    if self._tx_q.empty():
-                        async with self._lock:
-                            # If the connection is closed, the socket will be closed next time around in receive part of loop
-                            with suppress(ConnectionResetError):
-                                await self._loop.sock_sendall(self.conn, types.audio + PCM_SIZE + bytes(PACKET_LENGTH))
+                type_byte = header[0]
+                if type_byte == audio_type:
+                    # If read() isn't keeping up, maxlen silently drops the oldest frame
+                    rx_append(payload)
+                    rx_ready_set()
+                    if self._tx_count == 0:
+                        # If the connection is closed, the reader will notice next time around the loop
+                        with suppress(ConnectionResetError):
+                            writer_write(_SILENCE_FRAME)
+                            if buffered() > _DRAIN_THRESHOLD:
+                                await writer_drain()
                     else:
-                        audio_data = await self._tx_q.get()
-                        if len(audio_data) > PACKET_LENGTH:
-                            logger.warning("Audio data is greater than PACKET_LENGTH bytes, truncating to PACKET_LENGTH bytes")
-                            audio_data = audio_data[:PACKET_LENGTH]
-
-                        async with self._lock:
-                            # If the connection is closed, the socket will be closed next time around in receive part of loop
+                        # Ring slots are always full frames, so the header is constant.
+                        # Materialize the slice before handing it to the transport:
+                        # uvloop keeps zero-copy references to written buffers until
+                        # they flush, so a view into the ring could be overwritten by
+                        # a producer once the slot is released below
+                        offset = self._tx_head * PACKET_LENGTH
+                        frame = bytes(tx_ring[offset : offset + PACKET_LENGTH])
+                        with suppress(ConnectionResetError):
+                            writer_write(_AUDIO_HDR_320)
+                            writer_write(frame)
+                        # Advance the ring before any await: if clear_send_queue()
+                        # resets the indices while we wait on drain, a decrement
+                        # here afterwards would drive _tx_count negative and
+                        # desync the ring for the rest of the connection
+                        self._tx_head = (self._tx_head + 1) % _TX_RING_FRAMES
+                        self._tx_count -= 1
+                        tx_not_full_set()
+                        if buffered() > _DRAIN_THRESHOLD:
                             with suppress(ConnectionResetError):
-                                await self._loop.sock_sendall(self.conn, types.audio + len(audio_data).to_bytes(2, 'big') + audio_data)
-                        self._tx_q.task_done()
-                elif type_byte == types.dtmf:
-                    logger.debug(f"AsyncConnection._process DTMF: {payload}")
-                    if 'dtmf' in self._event_callbacks:
-                        asyncio.create_task(self._event_callbacks['dtmf'](payload))
-                elif type_byte == types.error:
-                    logger.debug(f"AsyncConnection._process ERROR: {payload}")
-                    if 'error' in self._event_callbacks:
-                        asyncio.create_task(self._event_callbacks['error'](payload))
-                    self._decode_error(payload)
-                elif type_byte == types.uuid:
-                    logger.debug(f"AsyncConnection._process UUID: {payload}")
-                    if 'uuid' in self._event_callbacks:
-                        asyncio.create_task(self._event_callbacks['uuid'](payload))
-                    self._uuid = str(uuid.UUID(bytes=payload))
+                                await writer_drain()
                 else:
-                    logger.warning(f"Unknown type byte: {type_byte}")
+                    # Control frames are rare, so a dict lookup beats walking
+                    # an if/elif chain of bytes comparisons
+                    handler = dispatch.get(type_byte)
+                    if handler is not None:
+                        handler(payload)
+                    else:
+                        logger.warning(f"Unknown type byte: {type_byte}")
         except asyncio.CancelledError:
             logger.debug("AsyncConnection._process: cancelled, exiting")
             raise
@@ -388,8 +410,8 @@ class AudioSocketConnectionAsync(AsyncClass):
             # Give the hangup time to be sent
             await asyncio.sleep(0.2)
             # Close the connection
-            if hasattr(self, 'conn'):
-                self.conn.close()
+            if hasattr(self, '_writer'):
+                self._writer.close()
             self.connected = False
 
     async def close(self):
@@ -15,6 +15,11 @@ class MessageBroker(AsyncSingleton):
         self._active_conversations = {}
         self._pending_messages = {}
         self._rate_limiters = {}
+        # These headers only depend on config and our own number, so build
+        # them once instead of formatting them for every message
+        self._from_hdr = f"sip:{config.ASTERISK_PSTN_GATEWAY_USER}@{config.ASTERISK_PSTN_GATEWAY_HOST}"
+        self._variable_hdr = f"Remote-Party-ID=<sip:{our_number}@{config.ASTERISK_PSTN_GATEWAY_HOST}>"
+        self._dest_fmt = f"pjsip:{config.ASTERISK_PSTN_ENDPOINT}/<sip:{{}}@{config.ASTERISK_PSTN_GATEWAY_HOST}>"
         self._manager = Manager(
                 host=config.ASTERISK_HOST,
                 port=config.ASTERISK_AMI_PORT,
@@ -57,9 +62,12 @@ class MessageBroker(AsyncSingleton):
             while not queue.empty():
                 await pending.put(queue.get_nowait())
 
-    async def _ensure_rate_limiter(self, phone_number):
-        if phone_number not in self._rate_limiters:
-            self._rate_limiters[phone_number] = aiolimiter.AsyncLimiter(10) # 10 messages per minute
+    def _ensure_rate_limiter(self, phone_number):
+        # Plain dict lookup; no reason to pay a coroutine frame for this
+        limiter = self._rate_limiters.get(phone_number)
+        if limiter is None:
+            limiter = self._rate_limiters[phone_number] = aiolimiter.AsyncLimiter(10) # 10 messages per minute
+        return limiter
 
     async def message_received(self, sender_number, message):
         """
@@ -81,19 +89,19 @@ class MessageBroker(AsyncSingleton):
         :param message: The message to send
         :return: None
         """
-        await self._ensure_rate_limiter(recipient_number)
+        limiter = self._ensure_rate_limiter(recipient_number)
 
         message_action = Action({
             'Action': 'MessageSend',
-            'Destination': f"pjsip:{config.ASTERISK_PSTN_ENDPOINT}/<sip:{recipient_number}@{config.ASTERISK_PSTN_GATEWAY_HOST}>",
-            'From': f"sip:{config.ASTERISK_PSTN_GATEWAY_USER}@{config.ASTERISK_PSTN_GATEWAY_HOST}",
+            'Destination': self._dest_fmt.format(recipient_number),
+            'From': self._from_hdr,
             'Base64Body': base64.b64encode(message.encode('utf-8')).decode('utf-8'),
-            'Variable': f"Remote-Party-ID=<sip:{self._our_number}@{config.ASTERISK_PSTN_GATEWAY_HOST}>",
+            'Variable': self._variable_hdr,
         })
 
         # Ensure we don't send more than 10 messages per minute to the same number
         # and only one message at a time because I want to avoid potential issues with race conditions
-        async with self._message_lock, self._rate_limiters[recipient_number]:
+        async with self._message_lock, limiter:
             await self._manager.send_action(message_action)
 
     async def get_incoming_message(self, phone_number):
@@ -1,3 +1,5 @@
+import asyncio
+from functools import lru_cache
 from google.cloud import speech_v1 as speech
 from google.api_core.exceptions import OutOfRange
 
@@ -7,38 +9,61 @@ from asteramisk.internal.audiosocket_connection import AudioSocketConnectionAsyn
 import logging
 logger = logging.getLogger(__name__)
 
+# Batch this much audio (200ms at 8kHz 16-bit mono) into each streaming
+# request; Google accepts any chunking and larger chunks cut framing overhead
+_STT_CHUNK_SIZE = 3200
+
+
+@lru_cache(maxsize=32)
+def _streaming_config_request(hint_phrases, hint_boost):
+    # Building the config protobuf allocates a pile of small objects;
+    # hints rarely vary per deployment, so cache the assembled request
+    return speech.StreamingRecognizeRequest(
+        streaming_config=speech.StreamingRecognitionConfig(
+            config=speech.RecognitionConfig(
+                encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
+                speech_contexts=[
+                    speech.SpeechContext(
+                        phrases=list(hint_phrases),
+                        boost=hint_boost
+                    )
+                ],
+                model="phone_call",
+                sample_rate_hertz=8000,
+                enable_automatic_punctuation=True,
+                language_code="en-US",
+                use_enhanced=True,
+            ),
+        )
+    )
+
 class TranscribeEngine(AsyncClass):
     client = None
+    _client_lock = asyncio.Lock()
 
     async def __create__(self):
         # Use a global class level client rather than being a singleton
         # This is because we need to track the state of transcription per call (stream or instance)
-        if self.client is None:
-            self.client = speech.SpeechAsyncClient()
+        # Double-checked so concurrent first calls share one gRPC channel
+        if TranscribeEngine.client is None:
+            async with TranscribeEngine._client_lock:
+                if TranscribeEngine.client is None:
+                    TranscribeEngine.client = speech.SpeechAsyncClient()
         self.is_transcribing = False
 
     async def _transcribe_request_generator(self, stream: AudioSocketConnectionAsync, hint_phrases: list = [], hint_boost: float = 10.0):
-        yield speech.StreamingRecognizeRequest(
-            streaming_config=speech.StreamingRecognitionConfig(
-                config=speech.RecognitionConfig(
-                    encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-                    speech_contexts=[
-                        speech.SpeechContext(
-                            phrases=hint_phrases,
-                            boost=hint_boost
-                        )
-                    ],
-                    model="phone_call",
-                    sample_rate_hertz=8000,
-                    enable_automatic_punctuation=True,
-                    language_code="en-US",
-                    use_enhanced=True,
-                ),
-            )
-        )
+        yield _streaming_config_request(tuple(hint_phrases), hint_boost)
+        # Coalesce the 20ms frames into ~200ms chunks so we send a handful of
+        # gRPC messages per second instead of fifty
+        pending = bytearray()
         while stream.connected and self.is_transcribing:
             audio = await stream.read()
-            yield speech.StreamingRecognizeRequest(audio_content=audio)
+            pending += audio
+            if len(pending) >= _STT_CHUNK_SIZE:
+                yield speech.StreamingRecognizeRequest(audio_content=bytes(pending))
+                pending.clear()
+        if pending:
+            yield speech.StreamingRecognizeRequest(audio_content=bytes(pending))
 
     async def _transcribe_from_stream(self, stream: AudioSocketConnectionAsync, hint_phrases: list = [], hint_boost: float = 10.0):
         try:
@@ -1,8 +1,11 @@
 import os
 import io
 import wave
-import uuid
+import struct
 import asyncio
+import hashlib
+from functools import lru_cache
+from collections import OrderedDict
 from gtts import gTTS
 from pydub import AudioSegment
 from contextlib import suppress
@@ -15,35 +18,76 @@ from asteramisk.internal.async_singleton import AsyncSingleton
 import logging
 logger = logging.getLogger(__name__)
 
+# Canonical 44-byte PCM wav header layout
+_WAV_HDR = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+def _wav_header(data_len, sample_width, channels, sample_rate):
+    return _WAV_HDR.pack(
+        b'RIFF', 36 + data_len, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate,
+        sample_rate * channels * sample_width, channels * sample_width, sample_width * 8,
+        b'data', data_len
+    )
+
+# Single-pass translation table for _clean_text: space to dash, strip
+# punctuation and whitespace control characters
+_CLEAN_TRANS = str.maketrans({
+    ' ': '-',
+    '?': None,
+    ':': None,
+    "'": None,
+    '"': None,
+    '/': None,
+    '!': None,
+    '.': None,
+    ',': None,
+    '\n': None,
+    '\t': None,
+})
+
+@lru_cache(maxsize=4096)
+def _clean_text(text) -> str:
+    """ Make text more like file name, space to dash, lowercase, remove special characters and punctuation, newlines, tabs """
+    # Memoized: the same text is cleaned for the exists/get/save trio of
+    # every request, and prompts repeat heavily across calls
+    clean_text = text.lower().translate(_CLEAN_TRANS)
+    if '--' in clean_text:
+        clean_text = clean_text.replace("--", "-")
+    return clean_text
+
 class TTSEngine(AsyncSingleton):
     async def __create__(self):
         # Create the directory if it doesn't exist
         assert config.ASTERISK_SOUNDS_DIR is not None
         assert config.ASTERISK_TTS_SOUNDS_SUBDIR is not None
-        if not os.path.exists(f"{config.ASTERISK_SOUNDS_DIR}/{config.ASTERISK_TTS_SOUNDS_SUBDIR}"):
-            os.makedirs(f"{config.ASTERISK_SOUNDS_DIR}/{config.ASTERISK_TTS_SOUNDS_SUBDIR}")
+        # Formatted once; every cache path builds on this
+        self._sounds_dir = f"{config.ASTERISK_SOUNDS_DIR}/{config.ASTERISK_TTS_SOUNDS_SUBDIR}"
+        sounds_dir = self._sounds_dir
+        if not os.path.exists(sounds_dir):
+            os.makedirs(sounds_dir)
+
+        # Scan the cache directory once; afterwards existence checks are dict
+        # lookups instead of a stat() per request on the event loop thread.
+        # Ordered by recency of use so the disk cache can evict LRU-first
+        self._disk_index = OrderedDict(
+            (entry.name[:-4], entry.stat().st_size)
+            for entry in os.scandir(sounds_dir) if entry.name.endswith('.wav')
+        )
+        self._disk_bytes = sum(self._disk_index.values())
 
         self._client = texttospeech.TextToSpeechAsyncClient()
-        self.cache_tasks = []
+        # Tasks remove themselves on completion, so the set stays small and
+        # finished tasks (and the audio their closures hold) are freed promptly
+        self.cache_tasks = set()
         self.cache = LRUCache(maxsize=1000)
-        self._cache_lock = asyncio.Lock()
-
-    def _clean_text(self, text) -> str:
-        """ Make text more like file name, space to dash, lowercase, remove special characters and punctuation, newlines, tabs """
-        clean_text = text.lower()
-        clean_text = clean_text.replace(" ", "-")
-        clean_text = clean_text.replace("?", "")
-        clean_text = clean_text.replace(":", "")
-        clean_text = clean_text.replace("'", "")
-        clean_text = clean_text.replace('"', "")
-        clean_text = clean_text.replace("/", "")
-        clean_text = clean_text.replace("!", "")
-        clean_text = clean_text.replace(".", "")
-        clean_text = clean_text.replace(",", "")
-        clean_text = clean_text.replace("\n", "")
-        clean_text = clean_text.replace("\t", "")
-        clean_text = clean_text.replace("--", "-")
-        return clean_text
+        # Bounds concurrent synthesis requests so batched callers overlap
+        # network round-trips without stampeding the API
+        self._synth_sem = asyncio.Semaphore(int(config.TTS_CONCURRENCY))
+        # In-flight synthesis keyed by text and voice; concurrent requests for
+        # the same phrase await one result instead of each paying a synthesis
+        self._inflight = {}
+
+    _clean_text = staticmethod(_clean_text)
 
     async def _premium_tts(self, text, voice=None):
         input = texttospeech.SynthesisInput(text=text)
@@ -56,7 +100,12 @@ class TTSEngine(AsyncSingleton):
             sample_rate_hertz=8000
         )
         response = await self._client.synthesize_speech(input=input, voice=voice_params, audio_config=audio_config)
-        return response.audio_content
+        audio = response.audio_content
+        # LINEAR16 responses arrive in a wav container; strip the 44-byte
+        # header so callers get the raw PCM they expect
+        if audio.startswith(b'RIFF'):
+            audio = audio[44:]
+        return audio
 
     async def _free_tts(self, text):
         """ Use gTTS to convert text to audio and return the audio content """
@@ -69,10 +118,15 @@ class TTSEngine(AsyncSingleton):
             mp3_fp = io.BytesIO()
             tts.write_to_fp(mp3_fp)
             mp3_fp.seek(0)
-            # Convert mp3 to raw
-            audio = AudioSegment.from_mp3(mp3_fp)
-            audio_8khz = audio.set_frame_rate(8000)
-            raw_audio = audio_8khz.set_channels(1).set_sample_width(2).raw_data
+            # Have ffmpeg decode straight to 8kHz mono s16 in its single pass
+            # instead of decoding at the source rate and then paying three
+            # set_* copies to get there
+            audio = AudioSegment.from_file(
+                mp3_fp,
+                format="mp3",
+                parameters=["-ar", "8000", "-ac", "1", "-sample_fmt", "s16"]
+            )
+            raw_audio = audio.raw_data
 
             del tts
             del audio
@@ -92,34 +146,61 @@ class TTSEngine(AsyncSingleton):
             logger.debug("TTSEngine.tts: using cached audio file")
             return cached_audio
 
-        # Not cached, convert text to audio
-        audio = None
-        if not voice or not config.GOOGLE_APPLICATION_CREDENTIALS:
-            # Voice not specified or no credentials, so use gTTS which is free and requires no credentials
-            audio = await self._free_tts(text)
+        # If the same phrase is already being synthesized, wait for that
+        # result instead of paying a duplicate API round-trip
+        inflight_key = f"{self._clean_text(text)}-{voice}"
+        pending = self._inflight.get(inflight_key)
+        if pending is not None:
+            logger.debug("TTSEngine.tts: awaiting in-flight synthesis of the same text")
+            return await pending
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[inflight_key] = future
+        try:
+            # Not cached, convert text to audio
+            audio = None
+            async with self._synth_sem:
+                if not voice or not config.GOOGLE_APPLICATION_CREDENTIALS:
+                    # Voice not specified or no credentials, so use gTTS which is free and requires no credentials
+                    audio = await self._free_tts(text)
+                else:
+                    # Use google cloud tts which requires credentials
+                    audio = await self._premium_tts(text, voice)
+
+            # Trim chirp (first 80 ms). Slice the PCM directly: 80ms of 8kHz
+            # 16-bit mono is 1280 bytes, and going through an AudioSegment here
+            # copied the whole buffer twice just to drop them
+            if audio and len(audio) > 0:
+                audio = audio[1280:]
+        except BaseException as e:
+            if not future.done():
+                future.set_exception(e)
+                # Mark retrieved in case no one else is waiting
+                future.exception()
+            raise
         else:
-            # Use google cloud tts which requires credentials
-            audio = await self._premium_tts(text, voice)
-
-        # Trim the chirp 
-        if audio and len(audio) > 0:
-            audio_segment = AudioSegment(
-                data=audio,
-                sample_width=2,
-                frame_rate=8000,
-                channels=1
-            )
-            # Trim chirp (first 80 ms)
-            audio = audio_segment[80:].raw_data
+            future.set_result(audio)
+        finally:
+            self._inflight.pop(inflight_key, None)
+
         if save_to_cache:
-            async with self._cache_lock:
-                # Make sure cache_tasks list doesn't grow too long by removing completed tasks
-                self.cache_tasks = [task for task in self.cache_tasks if not task.done()]
-                self.cache_tasks.append(asyncio.create_task(self.save_to_cache(audio, text, voice)))
+            task = asyncio.create_task(self.save_to_cache(audio, text, voice))
+            self.cache_tasks.add(task)
+            task.add_done_callback(self.cache_tasks.discard)
         if not audio or len(audio) == 0:
             logger.error("TTSEngine.tts: no audio returned")
         return audio
 
+    async def tts_many(self, texts, voice=None, save_to_cache=True):
+        """
+        Synthesize several texts concurrently, e.g. a sentence-chunked prompt.
+        Concurrency is bounded by config.TTS_CONCURRENCY
+        :param texts: Iterable of texts to convert to audio
+        :param voice: The voice to use, e.g. 'en-US-Wavenet-A'
+        :return: List of audio buffers in the same order as the texts
+        """
+        return await asyncio.gather(*[self.tts(text, voice, save_to_cache=save_to_cache) for text in texts])
+
     async def tts_to_stream(self, text, stream, voice=None):
         audio = await self.tts(text, voice)
         await stream.write(audio)
@@ -141,38 +222,39 @@ class TTSEngine(AsyncSingleton):
         if ast_filename:
             filename = f"{config.ASTERISK_TTS_SOUNDS_SUBDIR}/{filename}"
         else:
-            filename = f"{config.ASTERISK_SOUNDS_DIR}/{config.ASTERISK_TTS_SOUNDS_SUBDIR}/{filename}.wav"
+            filename = f"{self._sounds_dir}/{filename}.wav"
         return filename
 
     async def save_to_wav(self, audio, filename, sample_width=2, channels=1, sample_rate=8000):
         def _save_to_wav():
-            full_path = f"{config.ASTERISK_SOUNDS_DIR}/{config.ASTERISK_TTS_SOUNDS_SUBDIR}/{filename}.wav"
-            with wave.open(full_path, "wb") as f:
-                f.setnchannels(channels)
-                f.setsampwidth(sample_width)
-                f.setframerate(sample_rate)
-                f.writeframes(audio)
+            full_path = f"{self._sounds_dir}/{filename}.wav"
+            # Write the packed header and the PCM in one go; the wave module
+            # makes several small writes and a header-patching seek
+            with open(full_path, "wb") as f:
+                f.write(_wav_header(len(audio), sample_width, channels, sample_rate))
+                f.write(audio)
             return filename
         return await asyncio.to_thread(_save_to_wav)
 
     async def read_from_wav(self, filename):
         def _read_from_wav():
-            with wave.open(f"{config.ASTERISK_SOUNDS_DIR}/{config.ASTERISK_TTS_SOUNDS_SUBDIR}/{filename}.wav", "rb") as f:
+            with wave.open(f"{self._sounds_dir}/{filename}.wav", "rb") as f:
                 return f.readframes(f.getnframes())
         return await asyncio.to_thread(_read_from_wav)
 
     async def exists_in_cache(self, text, voice='gtts-en-ca') -> bool:
         text = self._clean_text(text)
         text_and_voice = f"{text}-{voice}"
-        return text_and_voice in self.cache and os.path.exists(f"{config.ASTERISK_SOUNDS_DIR}/{config.ASTERISK_TTS_SOUNDS_SUBDIR}/{self.cache[text_and_voice]}.wav")
+        return text_and_voice in self.cache and self.cache[text_and_voice] in self._disk_index
 
     async def get_from_cache(self, text, voice='gtts-en-ca'):
         text = self._clean_text(text)
         text_and_voice = f"{text}-{voice}"
         if text_and_voice in self.cache:
             filename = self.cache[text_and_voice]
-            filepath = f"{config.ASTERISK_SOUNDS_DIR}/{config.ASTERISK_TTS_SOUNDS_SUBDIR}/{filename}.wav"
-            if os.path.exists(filepath):
+            if filename in self._disk_index:
+                # Refresh recency so hot phrases survive disk eviction
+                self._disk_index.move_to_end(filename)
                 return await self.read_from_wav(filename)
         return None
 
@@ -184,18 +266,45 @@ class TTSEngine(AsyncSingleton):
         text_and_voice = f"{text}-{voice}"
         filename = text_and_voice
         if len(filename) > 200:
-            filename = uuid.uuid4().hex
+            # Hash long keys down to a fixed-length name. Unlike the old
+            # uuid4 fallback this is deterministic, so long prompts still hit
+            # the same file across restarts
+            filename = hashlib.sha256(text_and_voice.encode('utf-8')).hexdigest()[:32]
         # Save it so it can later be read and played
         await self.save_to_wav(audio_content, filename, sample_width=2, channels=1, sample_rate=8000)
         self.cache[text_and_voice] = filename
+        # 44 bytes of wav header plus the PCM payload
+        size = 44 + len(audio_content)
+        self._disk_bytes += size - self._disk_index.get(filename, 0)
+        self._disk_index[filename] = size
+        self._disk_index.move_to_end(filename)
+        await self._evict_lru_files()
         return filename
 
+    async def _evict_lru_files(self):
+        """ Delete least recently used cache files until the disk cache fits under the size cap """
+        max_bytes = int(config.TTS_CACHE_MAX_BYTES)
+        if self._disk_bytes <= max_bytes:
+            return
+
+        evicted = []
+        while self._disk_bytes > max_bytes and self._disk_index:
+            filename, size = self._disk_index.popitem(last=False)
+            self._disk_bytes -= size
+            evicted.append(filename)
+
+        def _unlink_all():
+            for filename in evicted:
+                with suppress(FileNotFoundError):
+                    os.remove(f"{self._sounds_dir}/{filename}.wav")
+
+        logger.debug(f"TTSEngine._evict_lru_files: evicting {len(evicted)} cached files")
+        await asyncio.to_thread(_unlink_all)
+
     async def close(self):
         """
         Close the TTSEngine and wait for all cache tasks to finish
         """
         logger.debug("TTSEngine.close")
-        async with self._cache_lock:
-            with suppress(asyncio.CancelledError):
-                await asyncio.gather(*self.cache_tasks)
-            self.cache_tasks = []
+        with suppress(asyncio.CancelledError):
+            await asyncio.gather(*self.cache_tasks)
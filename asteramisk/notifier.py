@@ -1,7 +1,7 @@
+import os
+import asyncio
 import logging
 import datetime
-import aiofiles
-import aiofiles.os
 import traceback
 from typing import Literal
 from asteramisk.communicator import Communicator
@@ -27,8 +27,16 @@ async def notify_exception(exception: Exception, recipient_number: str = config.
     logger.error("Notifying admin of exception")
     logger.exception(exception)
     datefilename = "exception_" + datetime.datetime.now().strftime("%Y-%m-%d") + ".log"
-    if not await aiofiles.os.path.exists(config.LOG_DIR):
-        await aiofiles.os.mkdir(config.LOG_DIR)
-    async with aiofiles.open(f"{config.LOG_DIR}/{datefilename}", "w") as f:
-        await f.write(traceback.format_exc())
+    # Format the traceback here while the exception context is still current,
+    # then do the whole mkdir/open/write in one thread hop; aiofiles would pay
+    # a separate executor round-trip for each of those steps
+    trace = traceback.format_exc()
+
+    def _write_log():
+        if not os.path.exists(config.LOG_DIR):
+            os.mkdir(config.LOG_DIR)
+        with open(f"{config.LOG_DIR}/{datefilename}", "w") as f:
+            f.write(trace)
+
+    await asyncio.to_thread(_write_log)
     await notify(f"An exception has occurred on system {config.SYSTEM_NAME}. {exception}. The full traceback has been logged to {config.LOG_DIR}/{datefilename}.", recipient_number, contact_method)
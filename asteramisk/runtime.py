@@ -0,0 +1,30 @@
+import os
+import asyncio
+
+import logging
+logger = logging.getLogger(__name__)
+
+def install_event_loop_policy():
+    """
+    Install the fastest available event loop policy for the process.
+    Called automatically on package import.
+    By default uvloop is used when installed, since it is substantially faster
+    than the default selector loop for the TCP-heavy audiosocket/AMI/ARI workloads here.
+    Set the ASTERAMISK_LOOP environment variable to override:
+
+    * ``uvloop``  - require uvloop, raise if it is not installed
+    * ``asyncio`` - keep the stdlib default loop
+    """
+    choice = os.getenv('ASTERAMISK_LOOP', '').strip().lower()
+    if choice == 'asyncio':
+        logger.debug("ASTERAMISK_LOOP=asyncio, keeping the default event loop")
+        return
+    try:
+        import uvloop
+    except ImportError:
+        if choice == 'uvloop':
+            raise ImportError("ASTERAMISK_LOOP=uvloop but uvloop is not installed. Install it with: pip install uvloop")
+        logger.debug("uvloop is not installed, keeping the default event loop")
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Installed uvloop event loop policy")